@@ -146,7 +146,7 @@ class Codecs:
     @staticmethod
     def encode_services(*args):
         int_values = map(lambda evt: Codecs._available_events[evt], args)
-        return reduce(operator.or_, int_values)
+        return reduce(operator.or_, int_values, 0)
     
     @staticmethod
     def encode_rgb(*args):
@@ -189,14 +189,18 @@ class Copernicus:
         'query': Command('11______', Codecs.encode_services)
     }
 
-    def __init__(self, timeout=None, connection=None, debug=False):
+    def __init__(self, timeout=None, connection=None, debug=False, auto_subscribe=False):
         """
         Creates a new Copernicus API object and loads default events and commands.
         :param timeout: Serial connection timeout for listen() calls. Either this of connection arg must be None.
         :param connection: Serial object to use for communication with Copernicus.
+        :param auto_subscribe: Whether subscriptions should follow registered handlers automatically.
         :type connection: serial.Serial
+        :type auto_subscribe: bool
         """
         self._debug = debug
+        self._auto_subscribe = auto_subscribe
+        self._subscribed_mask = None
         assert timeout is None or connection is None
 
         if timeout is not None and \
@@ -217,6 +221,8 @@ class Copernicus:
         self._handlers = {}
         self._default_handler = None
         self._commands = {}
+        self._reflexes = {}
+        self._reflex_table = [None] * 256
 
         self.load_events(self._default_events)
         self.load_commands(self._default_commands)
@@ -225,13 +231,16 @@ class Copernicus:
         """
         Loads new event set that is later used to translate serial responses to API events.
         Event set is simply a list of Event objects.
-        Calling this method discards all previously registered handlers.
+        Calling this method discards all previously registered handlers and reflexes.
         :type events: list[Event]
         """
         patterns = [event.pattern for event in events]
         BitPattern.assert_no_overlaps(patterns)
         self._events = events
         self._handlers = dict((event.name, None) for event in events)
+        self._reflexes = {}
+        self._reflex_table = [None] * 256
+        self._update_subscriptions()
 
     def set_handler(self, event, handler):
         """
@@ -245,6 +254,7 @@ class Copernicus:
         if event not in self._handlers:
             raise ValueError('Unknown event `{0}`'.format(event))
         self._handlers[event] = handler
+        self._update_subscriptions()
 
     def set_default_handler(self, handler):
         """
@@ -254,6 +264,68 @@ class Copernicus:
         :type handler: (str, T) -> None
         """
         self._default_handler = handler
+        self._update_subscriptions()
+
+    def _update_subscriptions(self):
+        """
+        Subscribes to services that have handlers registered, if auto-subscription is enabled. Default handler requires
+        all services. A `subscribe` command is sent only if the resulting service mask differs from the current one.
+        """
+        if not self._auto_subscribe or 'subscribe' not in self._commands:
+            return
+        if self._default_handler is not None:
+            services = ['*']
+        else:
+            services = [name for name, handler in self._handlers.items()
+                        if (handler is not None or name in self._reflexes) and name in Codecs._available_events]
+        mask = Codecs.encode_services(*services)
+        if mask != self._subscribed_mask:
+            self.command('subscribe', *services)
+            self._subscribed_mask = mask
+
+    def set_reflex(self, event, cmd, transform=None):
+        """
+        Registers a reflex: a command that is sent straight from listen() each time event is fired, e.g. knob -> servo.
+        Reflexes are compiled to a byte-to-byte lookup table, so they don't involve any handler calls. Events handled by
+        a reflex are not passed to handlers. Overwrites previously registered reflex.
+        :param event: Name of event that should trigger the command
+        :param cmd: Name of command to be sent or None to remove the reflex
+        :param transform: Function mapping event's value to command's argument, or to a tuple of arguments
+        :type event: str
+        :type cmd: str
+        :type transform: (T) -> *
+        """
+        if event not in self._handlers:
+            raise ValueError('Unknown event `{0}`'.format(event))
+        reflexes = dict(self._reflexes)
+        if cmd is None:
+            reflexes.pop(event, None)
+        else:
+            if cmd not in self._commands:
+                raise KeyError('Unknown command {0}'.format(cmd))
+            reflexes[event] = (cmd, transform if transform is not None else lambda x: x)
+        self._reflex_table = self._compile_reflexes(reflexes)
+        self._reflexes = reflexes
+        self._update_subscriptions()
+
+    def _compile_reflexes(self, reflexes):
+        """
+        Precomputes command bytes that should be sent in response to each possible incoming byte.
+        :type reflexes: dict[str, (str, (T) -> *)]
+        :rtype list[chr]
+        """
+        table = [None] * 256
+        for event in self._events:
+            if event.name not in reflexes:
+                continue
+            cmd, transform = reflexes[event.name]
+            low, high = event.pattern.bounds
+            for value in range(low, high + 1):
+                args = transform(event.transform(event.extract_arg('{0:b}'.format(value))))
+                if not isinstance(args, tuple):
+                    args = (args,)
+                table[value] = self._commands[cmd].translate(*args)
+        return table
 
     def handle(self, value):
         """
@@ -289,7 +361,13 @@ class Copernicus:
         if len(char) > 0:
             if self._debug:
                 print('Byte received: {0:b}'.format(ord(char)))
-            self.handle(char)
+            reflex = self._reflex_table[ord(char)]
+            if reflex is not None:
+                self._connection.write(reflex)
+                if self._debug:
+                    print('Byte sent: {0:b}'.format(ord(reflex)))
+            else:
+                self.handle(char)
             return True
         else:
             if self._debug:
@@ -299,12 +377,16 @@ class Copernicus:
     def load_commands(self, commands):
         """
         Loads new Copernicus command set that is later used to translate API commands to serial queries.
+        Calling this method discards all previously registered reflexes.
         :param commands: A dict with command names as keys and Command objects as values
         :type commands: dict[str, Command]
         """
         patterns = map(lambda cmd: cmd.pattern, commands.values())
         BitPattern.assert_no_overlaps(patterns)
         self._commands = commands
+        self._reflexes = {}
+        self._reflex_table = [None] * 256
+        self._update_subscriptions()
 
     def command(self, cmd, *args):
         """
@@ -0,0 +1,54 @@
+import unittest
+from mock import MagicMock
+from copernicus import Copernicus
+
+__author__ = 'gronostaj'
+
+
+# noinspection PyTypeChecker
+class AutoSubscribeTests(unittest.TestCase):
+    @staticmethod
+    def get_api():
+        serial_mock = MagicMock()
+        api = Copernicus(connection=serial_mock, auto_subscribe=True)
+        serial_mock.write.reset_mock()
+        return api, serial_mock
+
+    def test_should_not_subscribe_by_default(self):
+        serial_mock = MagicMock()
+        api = Copernicus(connection=serial_mock)
+        api.set_handler('knob', MagicMock())
+        api.set_default_handler(MagicMock())
+        assert not serial_mock.write.called
+
+    def test_should_clear_subscriptions_on_start(self):
+        serial_mock = MagicMock()
+        Copernicus(connection=serial_mock, auto_subscribe=True)
+        serial_mock.write.assert_called_once_with(chr(128))
+
+    def test_should_subscribe_to_handled_events(self):
+        api, serial_mock = AutoSubscribeTests.get_api()
+        api.set_handler('knob', MagicMock())
+        serial_mock.write.assert_called_once_with(chr(128 + 4))
+        api.set_handler('light', MagicMock())
+        serial_mock.write.assert_called_with(chr(128 + 4 + 32))
+
+    def test_should_not_resend_unchanged_subscription(self):
+        api, serial_mock = AutoSubscribeTests.get_api()
+        api.set_handler('knob', MagicMock())
+        api.set_handler('knob', MagicMock())
+        serial_mock.write.assert_called_once_with(chr(128 + 4))
+
+    def test_should_unsubscribe_when_handler_is_removed(self):
+        api, serial_mock = AutoSubscribeTests.get_api()
+        api.set_handler('knob', MagicMock())
+        api.set_handler('knob', None)
+        serial_mock.write.assert_called_with(chr(128))
+
+    def test_should_subscribe_to_all_events_for_default_handler(self):
+        api, serial_mock = AutoSubscribeTests.get_api()
+        api.set_handler('knob', MagicMock())
+        api.set_default_handler(MagicMock())
+        serial_mock.write.assert_called_with(chr(128 + 63))
+        api.set_default_handler(None)
+        serial_mock.write.assert_called_with(chr(128 + 4))
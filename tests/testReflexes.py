@@ -0,0 +1,96 @@
+import unittest
+from mock import MagicMock
+from copernicus import Copernicus
+
+__author__ = 'gronostaj'
+
+
+# noinspection PyTypeChecker
+class ReflexesTests(unittest.TestCase):
+
+    def test_should_send_reflex_command(self):
+        serial_mock = MagicMock()
+        serial_mock.read.return_value = chr(int('01111111', 2))
+        api = Copernicus(connection=serial_mock)
+        api.set_reflex('knob', 'servo', lambda value: value // 2)
+        api.listen()
+        serial_mock.write.assert_called_once_with(chr(31))
+
+    def test_should_apply_event_transform(self):
+        serial_mock = MagicMock()
+        serial_mock.read.return_value = chr(int('11000011', 2))
+        api = Copernicus(connection=serial_mock)
+        api.set_reflex('button1', 'led')
+        api.listen()
+        serial_mock.write.assert_called_once_with(chr(int('00100001', 2)))
+
+    def test_should_not_call_handlers_for_reflex(self):
+        serial_mock = MagicMock()
+        serial_mock.read.return_value = chr(int('01000000', 2))
+        api = Copernicus(connection=serial_mock)
+        api.set_handler('knob', MagicMock(side_effect=Exception('Handler called')))
+        api.set_default_handler(MagicMock(side_effect=Exception('Default handler called')))
+        api.set_reflex('knob', 'servo', lambda value: value // 2)
+        api.listen()
+
+    def test_should_handle_events_without_reflex(self):
+        serial_mock = MagicMock()
+        serial_mock.read.return_value = chr(int('00000101', 2))
+        handler = MagicMock()
+        api = Copernicus(connection=serial_mock)
+        api.set_reflex('knob', 'servo', lambda value: value // 2)
+        api.set_handler('light', handler)
+        api.listen()
+        handler.assert_called_once_with(5)
+        assert not serial_mock.write.called
+
+    def test_should_remove_reflex(self):
+        serial_mock = MagicMock()
+        serial_mock.read.return_value = chr(int('01000000', 2))
+        api = Copernicus(connection=serial_mock)
+        api.set_reflex('knob', 'servo', lambda value: value // 2)
+        api.set_reflex('knob', None)
+        api.listen()
+        assert not serial_mock.write.called
+
+    def test_should_reject_unknown_event_or_command(self):
+        api = Copernicus(connection=MagicMock())
+        with self.assertRaises(ValueError):
+            api.set_reflex('unknown', 'servo')
+        with self.assertRaises(KeyError):
+            api.set_reflex('knob', 'unknown')
+
+    def test_should_reject_out_of_range_reflex_on_registration(self):
+        serial_mock = MagicMock()
+        serial_mock.read.return_value = chr(int('01000010', 2))
+        handler = MagicMock()
+        api = Copernicus(connection=serial_mock)
+        api.set_handler('knob', handler)
+        with self.assertRaises(ValueError):
+            api.set_reflex('knob', 'servo')
+        api.set_reflex('button1', 'led')
+        api.listen()
+        handler.assert_called_once_with(2)
+        assert not serial_mock.write.called
+
+    def test_should_not_subscribe_to_rejected_reflex_events(self):
+        serial_mock = MagicMock()
+        api = Copernicus(connection=serial_mock, auto_subscribe=True)
+        with self.assertRaises(ValueError):
+            api.set_reflex('knob', 'servo')
+        api.set_handler('light', MagicMock())
+        serial_mock.write.assert_called_with(chr(128 + 32))
+
+    def test_should_pass_tuple_as_command_arguments(self):
+        serial_mock = MagicMock()
+        serial_mock.read.return_value = chr(int('11000101', 2))
+        api = Copernicus(connection=serial_mock)
+        api.set_reflex('button2', 'rgb', lambda state: (3, 0, 0) if state else (0, 0, 0))
+        api.listen()
+        serial_mock.write.assert_called_once_with(chr(int('01110000', 2)))
+
+    def test_should_subscribe_to_reflex_events(self):
+        serial_mock = MagicMock()
+        api = Copernicus(connection=serial_mock, auto_subscribe=True)
+        api.set_reflex('knob', 'servo', lambda value: value // 2)
+        serial_mock.write.assert_called_with(chr(128 + 4))